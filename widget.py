@@ -1,15 +1,116 @@
+import time
 import sys
 import os
-import glob
 import json
 import serial
-import time
 import shutil
 from PySide6.QtWidgets import QApplication, QWidget, QFileDialog
 from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtCore import QProcess, QTimer, QThread, Signal
 from ui_form import Ui_Widget
 
+# Reference point for the time-to-flash-ready metric. Interpreter startup and the
+# module imports above (PySide6, serial) happen before this and are not included.
+APP_START_TIME = time.perf_counter()
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+MPLABX_DIR = os.path.join("Microchip", "MPLABX")
+IPECMD_RELATIVE_PATH = os.path.join("mplab_platform", "mplab_ipe", "ipecmd.exe")
+TELIT_TOOL_NAME = "Telit_Wifi_Image_Tool.exe"
+MP_IMAGE_TOOL_NAME = "1-10_MP_Image_Tool.exe"
+# Bundled tools: cache key -> (file name, subdirectories to look in)
+OPTIONAL_TOOLS = {
+    "telit_tool": (TELIT_TOOL_NAME, ("",)),
+    "mp_image_tool": (MP_IMAGE_TOOL_NAME, ("we310_tools", "")),
+}
+
+
+def mplabx_version_key(name):
+    """Turn an MPLABX version folder name like 'v6.20' into a sortable tuple."""
+    parts = name.lstrip("vV").split(".")
+    try:
+        return tuple(int(part) for part in parts)
+    except ValueError:
+        return ()
+
+
+def find_ipecmd_candidates():
+    """Return the ipecmd.exe paths of all installed MPLABX versions, newest first.
+
+    Only the known install layout is checked (one directory listing per Program Files
+    root) instead of walking the whole tree, which is slow on redirected profiles.
+    """
+    roots = []
+    # ProgramW6432 is the 64-bit Program Files folder, even when running a 32-bit Python
+    for env_var, default in (
+        ("ProgramW6432", r"C:\Program Files"),
+        ("ProgramFiles", r"C:\Program Files"),
+        ("ProgramFiles(x86)", r"C:\Program Files (x86)"),
+    ):
+        root = os.environ.get(env_var, default)
+        if root not in roots:
+            roots.append(root)
+
+    versions = []
+    for root in roots:
+        mplabx_path = os.path.join(root, MPLABX_DIR)
+        try:
+            entries = os.listdir(mplabx_path)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.lower().startswith("v"):
+                versions.append((mplabx_version_key(entry), os.path.join(mplabx_path, entry, IPECMD_RELATIVE_PATH)))
+
+    versions.sort(key=lambda version: version[0], reverse=True)
+    return [path for _, path in versions if os.path.isfile(path)]
+
+
+def find_local_tool(file_name, subdirs=("",)):
+    """Look for a bundled tool next to the application and in the working directory."""
+    for base in dict.fromkeys((APP_DIR, os.getcwd())):
+        for subdir in subdirs:
+            path = os.path.join(base, subdir, file_name)
+            if os.path.isfile(path):
+                return path
+    return ""
+
+
+def find_optional_tool(name):
+    """Look up one of the bundled OPTIONAL_TOOLS by its cache key."""
+    file_name, subdirs = OPTIONAL_TOOLS[name]
+    return find_local_tool(file_name, subdirs)
+
+
+def is_network_path(path):
+    """Return True for UNC paths and mapped network drives, which may only be temporarily unreachable."""
+    if path.startswith(("\\\\", "//")):
+        return True
+    drive = os.path.splitdrive(path)[0]
+    if drive and sys.platform == "win32":
+        import ctypes
+        return ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == 4  # DRIVE_REMOTE
+    return False
+
+
+def discover_toolchain():
+    """Locate ipecmd, the Telit image tool and the MP image tool."""
+    ipecmd_paths = find_ipecmd_candidates()
+    toolchain = {"ipecmd": ipecmd_paths[0] if ipecmd_paths else ""}
+    for name in OPTIONAL_TOOLS:
+        toolchain[name] = find_optional_tool(name)
+    return toolchain
+
+
+# Thread class for locating the toolchain without blocking the UI on startup
+class ToolchainDiscoveryThread(QThread):
+    discovery_complete = Signal(dict)  # Signal carrying the discovered tool paths
+
+    def run(self):
+        """Override the run method to search for the tools in a separate thread."""
+        self.discovery_complete.emit(discover_toolchain())
+
+
 # Create a new thread class for handling firmware verification via COM port
 class FirmwareVerificationThread(QThread):
     verification_complete = Signal(bool)  # Signal to notify when verification is complete
@@ -64,6 +165,9 @@ class Widget(QWidget):
         self.flash_process = QProcess(self)
         self.telit_process = QProcess(self)
         self.verification_thread = None  # Initialize the firmware verification thread as None
+        self.discovery_thread = None  # Initialize the toolchain discovery thread as None
+        self.toolchain = {}  # Cached tool paths ("" = not found by the last search), validated on startup
+        self.flash_ready_reported = False
 
         # Connect signals to the respective slots for QProcesses
         self.flash_process.readyReadStandardOutput.connect(self.read_flash_output)
@@ -81,8 +185,8 @@ class Widget(QWidget):
         # Load saved paths, counter value, and hotkey from configuration file
         self.load_paths()
 
-        # Only search for ipecmd automatically if the path is not already saved
-        if not self.ui.IPECMDPathBox.text():
+        # Only search for the toolchain if ipecmd is unusable or the cache is missing/stale
+        if not self.validate_toolchain():
             self.find_ipecmd()
 
         # Connect buttons to respective functions
@@ -103,6 +207,9 @@ class Widget(QWidget):
         # Set the counter display
         self.ui.Counter.display(self.counter_value)
 
+        # Report the startup metric once the event loop is running and the window is shown
+        QTimer.singleShot(0, self.report_flash_ready)
+
     def update_progress(self, step_increment=1):
         """Update the progress bar by incrementing the step count."""
         self.current_step += step_increment
@@ -122,19 +229,86 @@ class Widget(QWidget):
             if self.current_shortcut:  # Enable the hotkey if it exists
                 self.current_shortcut.setEnabled(True)
 
+    def validate_toolchain(self):
+        """Drop stale cached tool paths and return True if no search is needed."""
+        self.toolchain = {name: path for name, path in self.toolchain.items() if not path or os.path.isfile(path)}
+
+        # Looking for the bundled tools is only a few file checks, so retry the ones not found last time
+        found_tool = False
+        for name in OPTIONAL_TOOLS:
+            if self.toolchain.get(name) == "":
+                self.toolchain[name] = find_optional_tool(name)
+                found_tool = found_tool or bool(self.toolchain[name])
+        if found_tool:
+            self.save_paths()
+
+        ipecmd_path = self.ui.IPECMDPathBox.text()
+        if not ipecmd_path and self.toolchain.get("ipecmd"):
+            self.ui.IPECMDPathBox.setText(self.toolchain["ipecmd"])
+            ipecmd_path = self.toolchain["ipecmd"]
+        elif ipecmd_path and not os.path.isfile(ipecmd_path):
+            self.ui.DebugWindow.append(f"Saved ipecmd.exe not found: {ipecmd_path}")
+
+        if os.path.isfile(ipecmd_path) and all(name in self.toolchain for name in OPTIONAL_TOOLS):
+            self.report_missing_tools()
+            return True
+        return False
+
+    def report_missing_tools(self):
+        """Log the optional tools that the last search could not find."""
+        for name, (file_name, _) in OPTIONAL_TOOLS.items():
+            if not self.toolchain.get(name):
+                self.ui.DebugWindow.append(f"{file_name} not found.")
+
     def find_ipecmd(self):
-        """Attempt to automatically find ipecmd.exe in the predefined directory if it's not already set."""
-        search_path = r"C:\Program Files\Microchip\MPLABX\v5.50\mplab_platform\mplab_ipe"
-        ipecmd_path = glob.glob(os.path.join(search_path, "**", "ipecmd.exe"), recursive=True)
-
-        if ipecmd_path:
-            # Automatically found the path, set it in the UI and save
-            ipecmd_path = ipecmd_path[0]  # Use the first match found
-            self.ui.IPECMDPathBox.setText(ipecmd_path)
-            self.save_paths()  # Save the automatically found path
-        else:
-            # If not found, prompt the user to manually select the path
-            self.ui.DebugWindow.append("ipecmd.exe not found. Please select it manually.")
+        """Search for ipecmd.exe and the bundled tools in the background."""
+        self.ui.DebugWindow.append("Searching for toolchain...")
+        self.discovery_thread = ToolchainDiscoveryThread(self)
+        self.discovery_thread.discovery_complete.connect(self.on_discovery_complete)
+        self.discovery_thread.start()
+
+    def on_discovery_complete(self, toolchain):
+        """Merge the discovered tool paths into the cache and update the UI."""
+        changed = False
+        for name, path in toolchain.items():
+            # Keep valid cached paths, only fill in tools that were unknown or not found before
+            if name not in self.toolchain or (path and not self.toolchain[name]):
+                self.toolchain[name] = path
+                changed = True
+
+        ipecmd_path = self.ui.IPECMDPathBox.text()
+        found_ipecmd = self.toolchain.get("ipecmd")
+        if not os.path.isfile(ipecmd_path):
+            if found_ipecmd and ipecmd_path and is_network_path(ipecmd_path):
+                # Keep the saved path, the share may only be temporarily unavailable
+                self.ui.DebugWindow.append(f"Found ipecmd.exe at {found_ipecmd} - use Browse to switch.")
+            elif found_ipecmd:
+                # Automatically found the path (or a replacement for a stale local one), set it in the UI
+                self.ui.IPECMDPathBox.setText(found_ipecmd)
+                self.ui.DebugWindow.append(f"Using ipecmd.exe at {found_ipecmd}")
+                changed = True
+            else:
+                # If not found, prompt the user to manually select the path
+                self.ui.DebugWindow.append("ipecmd.exe not found. Please select it manually.")
+        self.report_missing_tools()
+
+        if changed:
+            self.save_paths()  # Save the discovered paths
+        self.report_flash_ready()
+
+    def report_flash_ready(self):
+        """Log the time from application start until flashing is possible (reported once)."""
+        if self.flash_ready_reported or not os.path.isfile(self.ui.IPECMDPathBox.text()):
+            return
+        self.flash_ready_reported = True
+        elapsed_ms = (time.perf_counter() - APP_START_TIME) * 1000
+        self.ui.DebugWindow.append(f"Ready to flash after {elapsed_ms:.0f} ms.")
+
+    def closeEvent(self, event):
+        """Wait for a running toolchain search before the window is destroyed."""
+        if self.discovery_thread is not None and self.discovery_thread.isRunning():
+            self.discovery_thread.wait()
+        super().closeEvent(event)
 
     def flash_button_clicked(self):
 
@@ -279,7 +453,7 @@ class Widget(QWidget):
 
     def flash_telit(self):
         """Flash the Telit module using Telit_Wifi_Image_Tool.exe."""
-        telit_tool = "Telit_Wifi_Image_Tool.exe"
+        telit_tool = self.toolchain.get("telit_tool") or TELIT_TOOL_NAME
         telit_file_path = self.ui.TelitPathBox.text()
 
         if not telit_file_path:
@@ -362,6 +536,7 @@ class Widget(QWidget):
         if file_path:
             self.ui.IPECMDPathBox.setText(file_path)
             self.save_paths()
+            self.report_flash_ready()
 
     def set_hotkey(self):
         """Set the hotkey for flashing based on user input."""
@@ -383,13 +558,14 @@ class Widget(QWidget):
             self.ui.DebugWindow.append("No valid hotkey set.")
 
     def save_paths(self):
-        """Save the MCU, Telit, and IPECMD paths, hotkey, and counter to a JSON file."""
+        """Save the MCU, Telit, and IPECMD paths, hotkey, counter, and toolchain cache to a JSON file."""
         paths = {
             "mcu_file": self.ui.MCUPathBox.text(),
             "telit_file": self.ui.TelitPathBox.text(),
             "ipecmd_file": self.ui.IPECMDPathBox.text(),
             "hotkey": self.ui.SetFlashHotkey.keySequence().toString(),
-            "counter": self.counter_value
+            "counter": self.counter_value,
+            "toolchain": self.toolchain
         }
         try:
             with open(self.CONFIG_FILE, 'w') as config_file:
@@ -398,7 +574,7 @@ class Widget(QWidget):
             self.ui.DebugWindow.append(f"Error saving paths: {str(e)}")
 
     def load_paths(self):
-        """Load the saved MCU, Telit, IPECMD paths, hotkey, and counter from the JSON file."""
+        """Load the saved MCU, Telit, IPECMD paths, hotkey, counter, and toolchain cache from the JSON file."""
         if not os.path.exists(self.CONFIG_FILE):
             self.save_default_paths()
         else:
@@ -408,6 +584,11 @@ class Widget(QWidget):
                     self.ui.MCUPathBox.setText(paths.get("mcu_file", ""))
                     self.ui.TelitPathBox.setText(paths.get("telit_file", ""))
                     self.ui.IPECMDPathBox.setText(paths.get("ipecmd_file", ""))
+                    toolchain = paths.get("toolchain", {})
+                    if isinstance(toolchain, dict) and all(isinstance(path, str) for path in toolchain.values()):
+                        self.toolchain = toolchain
+                    else:
+                        self.ui.DebugWindow.append("Ignoring invalid toolchain cache in config.")
                     hotkey = paths.get("hotkey", "")
                     if hotkey:
                         self.ui.SetFlashHotkey.setKeySequence(QKeySequence(hotkey))
@@ -424,7 +605,8 @@ class Widget(QWidget):
             "telit_file": "",
             "ipecmd_file": "",
             "hotkey": "",
-            "counter": 0
+            "counter": 0,
+            "toolchain": {}
         }
         try:
             with open(self.CONFIG_FILE, 'w') as config_file: